@@ -1,13 +1,16 @@
 import argparse
+import asyncio
 import logging
 import sys
-from typing import Dict
+from typing import Dict, List
 
 from vfs_appointment_bot.utils.config_reader import get_config_value, initialize_config
 from vfs_appointment_bot.utils.timer import countdown
 from vfs_appointment_bot.vfs_bot.vfs_bot import LoginError
+from vfs_appointment_bot.vfs_bot.vfs_bot_async import poll_bots
 from vfs_appointment_bot.vfs_bot.vfs_bot_factory import (
     UnsupportedCountryError,
+    get_async_vfs_bot,
     get_vfs_bot,
 )
 
@@ -17,7 +20,8 @@ class KeyValueAction(argparse.Action):
 
     This class handles parsing comma-separated key-value pairs provided through
     the `--appointment-params` argument. It ensures the format is valid (key=value)
-    and stores the parsed parameters as a dictionary.
+    and appends the parsed parameters as a dictionary, one per occurrence of the
+    argument (matching the order of the country codes).
     """
 
     def __call__(self, parser, namespace, values, option_string=None):
@@ -26,7 +30,8 @@ class KeyValueAction(argparse.Action):
                 key.strip(): value.strip()
                 for key, value in (item.split("=") for item in values.split(","))
             }
-            setattr(namespace, "appointment_params", appointment_params)
+            params_list: List[Dict[str, str]] = getattr(namespace, self.dest) or []
+            setattr(namespace, self.dest, params_list + [appointment_params])
         except ValueError:
             parser.error(
                 f"Invalid value format for {option_string}, use key=value pairs"
@@ -38,8 +43,9 @@ def main() -> None:
     Entry point for the VFS Appointment Bot.
 
     This function sets up logging, parses command-line arguments, and runs the VFS appointment
-    checking process in a continuous loop. It catches exceptions for unsupported countries and
-    unexpected errors, logging them appropriately.
+    checking process in a continuous loop. When several source/destination country pairs are
+    given, they are checked concurrently with the async bots. It catches exceptions for
+    unsupported countries and unexpected errors, logging them appropriately.
 
     Raises:
         UnsupportedCountryError: If the provided country code is not supported by the bot.
@@ -56,8 +62,9 @@ def main() -> None:
         "-sc",
         "--source-country-code",
         type=str,
-        help="The ISO 3166-1 alpha-2 source country code (refer to README)",
+        help="The ISO 3166-1 alpha-2 source country code (refer to README), repeat to check several countries",
         metavar="<country_code>",
+        action="append",
         required=True,
     )
 
@@ -65,8 +72,9 @@ def main() -> None:
         "-dc",
         "--destination-country-code",
         type=str,
-        help="The ISO 3166-1 alpha-2 destination country code (refer to README)",
+        help="The ISO 3166-1 alpha-2 destination country code (refer to README), repeat to check several countries",
         metavar="<country_code>",
+        action="append",
         required=True,
     )
 
@@ -81,12 +89,32 @@ def main() -> None:
     )
 
     args = parser.parse_args()
-    source_country_code = args.source_country_code
-    destination_country_code = args.destination_country_code
+    if len(args.source_country_code) != len(args.destination_country_code):
+        parser.error(
+            "Each source country code needs a matching destination country code"
+        )
+    routes = list(zip(args.source_country_code, args.destination_country_code))
+
+    # Appointment parameters are given per route, in the same order
+    params_list = args.appointment_params or []
+    bot_args = [
+        argparse.Namespace(
+            appointment_params=params_list[i] if i < len(params_list) else None
+        )
+        for i in range(len(routes))
+    ]
     try:
+        if len(routes) > 1:
+            bots = [
+                get_async_vfs_bot(source, destination) for source, destination in routes
+            ]
+            asyncio.run(poll_bots(bots, bot_args))
+            return
+
+        source_country_code, destination_country_code = routes[0]
         while True:
             vfs_bot = get_vfs_bot(source_country_code, destination_country_code)
-            appointment_found = vfs_bot.run(args)
+            appointment_found = vfs_bot.run(bot_args[0])
             if appointment_found:
                 break
             countdown(
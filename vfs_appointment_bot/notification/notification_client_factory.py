@@ -1,17 +1,21 @@
+from functools import lru_cache
+
 from vfs_appointment_bot.notification.notification_client import NotificationClient
+from vfs_appointment_bot.utils.config_reader import register_config_invalidation_hook
 
 
 class UnsupportedNotificationChannelError(Exception):
     """Raised when an unsupported notification channel is provided."""
 
 
+@lru_cache(maxsize=None)
 def get_notification_client(channel: str) -> NotificationClient:
     """Retrieves the appropriate notification client for a given channel.
 
     This function creates an instance of a notification client class based on the
     provided channel string. Currently supported channels include "telegram" and
     "slack". If an unsupported channel is provided, a `ValueError` exception is
-    raised.
+    raised. Clients are cached, so each channel is only set up once per process.
 
     Args:
         channel (str): The notification channel name.
@@ -39,3 +43,7 @@ def get_notification_client(channel: str) -> NotificationClient:
         raise UnsupportedNotificationChannelError(
             f"Notification channel '{channel}' is not supported"
         )
+
+
+# Clients copy their config section, so drop them when the config is reloaded
+register_config_invalidation_hook(get_notification_client.cache_clear)
@@ -1,6 +1,7 @@
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from vfs_appointment_bot.notification.notification_client import NotificationClient
 
@@ -20,11 +21,16 @@ class TelegramClient(NotificationClient):
 
         This constructor retrieves configuration settings from the "telegram"
         section of the application configuration and validates them using the
-        base class validation logic.
+        base class validation logic. It also sets up a pooled HTTP session
+        that is reused for every notification.
         """
         required_keys = ["bot_token", "chat_id", "parse_mode"]
         super().__init__("telegram", required_keys)
 
+        # Pooled session keeps the connection to the Telegram API alive between notifications
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
     def send_notification(self, message: str) -> None:
         """
         Sends a notification message through the Telegram channel.
@@ -45,5 +51,5 @@ class TelegramClient(NotificationClient):
             f"https://api.telegram.org/bot{bot_token}/sendMessage?"
             + f"chat_id={chat_id}&parse_mode={parse_mode}&text={message}"
         )
-        requests.get(url, timeout=3000).json()
+        self._session.get(url, timeout=3000).json()
         logging.info("Telegram message sent successfully!")
@@ -21,7 +21,8 @@ class TwilioClient(NotificationClient):
 
         This constructor retrieves configuration settings from the "twilio"
         section of the application configuration and validates them using the
-        base class validation logic.
+        base class validation logic. It also creates the Twilio REST client
+        that is reused for every notification.
         """
         required_config_keys = [
             "to_num",
@@ -33,6 +34,11 @@ class TwilioClient(NotificationClient):
         ]
         super().__init__("twilio", required_config_keys)
 
+        # A single REST client reuses its HTTP connection for messages and calls
+        self.__client = Client(
+            self.config.get("account_sid"), self.config.get("auth_token")
+        )
+
     def send_notification(self, message: str) -> None:
         """
         Sends a notification message through the Twilio channel.
@@ -46,68 +52,55 @@ class TwilioClient(NotificationClient):
             message (str): The message content to be sent as a Twilio SMS.
         """
         url: Optional[str] = self.config.get("url")
-        auth_token: str = self.config.get("auth_token")
-        account_sid: str = self.config.get("account_sid")
         to_num: str = self.config.get("to_num")
         from_num: str = self.config.get("from_num")
         call_enabled: bool = self.config.get("call_enabled", False)
 
-        self.__send_message(message, auth_token, account_sid, to_num, from_num)
+        self.__send_message(message, to_num, from_num)
 
         if call_enabled:
-            self.__call(url, auth_token, account_sid, to_num, from_num)
+            self.__call(url, to_num, from_num)
 
     def __send_message(
         self,
         message: str,
-        auth_token: str,
-        account_sid: str,
         to_num: str,
         from_num: str,
     ) -> None:
         """
         Sends an SMS message using the Twilio API.
 
-        This private helper method creates a Twilio client instance and uses it
-        to send an SMS message with the provided content to the specified recipient
-        phone number.
+        This private helper method uses the shared Twilio client to send an SMS
+        message with the provided content to the specified recipient phone number.
 
         Args:
             message (str): The message content to be sent.
-            auth_token (str): The Twilio account authentication token.
-            account_sid (str): The Twilio account SID.
             to_num (str): The recipient phone number.
             from_num (str): The Twilio phone number used to send the message.
         """
-        client = Client(account_sid, auth_token)
-        client.messages.create(to=to_num, from_=from_num, body=message)
+        self.__client.messages.create(to=to_num, from_=from_num, body=message)
         logging.info("Message sent successfully!")
 
     def __call(
         self,
         url: Optional[str],
-        auth_token: str,
-        account_sid: str,
         to_num: str,
         from_num: str,
     ) -> None:
         """
         Initiates a call using the Twilio API (if URL is provided).
 
-        This private helper method creates a Twilio client instance and uses it
-        to initiate a call to the specified recipient phone number, using a
-        pre-recorded URL for the call content (if provided in the configuration).
+        This private helper method uses the shared Twilio client to initiate a
+        call to the specified recipient phone number, using a pre-recorded URL
+        for the call content (if provided in the configuration).
 
         Args:
             url (Optional[str]): The URL for the pre-recorded call content.
-            auth_token (str): The Twilio account authentication token.
-            account_sid (str): The Twilio account SID.
             to_num (str): The recipient phone number.
             from_num (str): The Twilio phone number used to initiate the call.
         """
         if url:
-            client = Client(account_sid, auth_token)
-            client.calls.create(from_=from_num, to=to_num, url=url)
+            self.__client.calls.create(from_=from_num, to=to_num, url=url)
             logging.info("Call request sent successfully!")
         else:
             logging.warning("No URL provided for call request!")
@@ -1,8 +1,10 @@
 import os
 from configparser import ConfigParser
-from typing import Dict
+from functools import lru_cache
+from typing import Callable, Dict, List
 
 _config: ConfigParser = None
+_invalidation_hooks: List[Callable[[], None]] = []
 
 
 def initialize_config(config_dir="config"):
@@ -26,6 +28,34 @@ def initialize_config(config_dir="config"):
     if user_config_path:
         _config.read(user_config_path)
 
+    invalidate_config_cache()
+
+
+def register_config_invalidation_hook(hook: Callable[[], None]) -> None:
+    """
+    Registers a callback to run whenever the configuration cache is invalidated.
+
+    Modules caching objects built from the configuration use this to drop them
+    together with the configuration lookups.
+
+    Args:
+        hook: A callable taking no arguments, e.g. an `lru_cache`'s `cache_clear`.
+    """
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_config_cache() -> None:
+    """
+    Clears the cached configuration lookups and runs the registered invalidation hooks.
+
+    Must be called whenever the underlying configuration is (re)loaded or
+    modified, so that neither `get_config_value` nor the objects cached by
+    other modules (see `register_config_invalidation_hook`) serve stale values.
+    """
+    get_config_value.cache_clear()
+    for hook in _invalidation_hooks:
+        hook()
+
 
 def get_config_section(section: str, default: Dict = None) -> Dict:
     """
@@ -45,10 +75,14 @@ def get_config_section(section: str, default: Dict = None) -> Dict:
         return default or {}
 
 
+@lru_cache(maxsize=None)
 def get_config_value(section: str, key: str, default: str = None) -> str:
     """
     Get a specific configuration value.
 
+    Lookups are memoized; call `invalidate_config_cache` after changing the
+    configuration.
+
     Args:
         section: The name of the section containing the value.
         key: The name of the key to retrieve.
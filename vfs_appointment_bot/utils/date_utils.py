@@ -1,9 +1,10 @@
 import re
 
+_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}|\d{2}-\d{2}-\d{4}|\d{2}-\d{2}-\d{2})")
+
 
 def extract_date_from_string(text):
-    pattern = r"(\d{4}-\d{2}-\d{2}|\d{2}-\d{2}-\d{4}|\d{2}-\d{2}-\d{2})"
-    match = re.search(pattern, text)
+    match = _DATE_PATTERN.search(text)
     if match:
         return match.group()
     else:
@@ -1,31 +1,198 @@
 import argparse
+import atexit
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import reduce
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import playwright
-from playwright.sync_api import sync_playwright
-from playwright_stealth import stealth_sync
-
-from twocaptcha import TwoCaptcha
+from playwright.sync_api import BrowserContext, Playwright, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from vfs_appointment_bot.utils.config_reader import get_config_value
 from vfs_appointment_bot.notification.notification_client_factory import (
     get_notification_client,
 )
 
+logger = logging.getLogger(__name__)
+
+LOGIN_ATTEMPTS = 3
+# Fail fast on stuck pages and let the login retry loop recover
+DEFAULT_TIMEOUT_MS = 60_000
+
 
 class LoginError(Exception):
     """Exception raised when login fails."""
 
 
-class VfsBot(ABC):
+LOGIN_FAILED_MESSAGE = (
+    "\033[1;31mLogin failed. "
+    + "Please verify your username and password by logging in to the browser and try again.\033[0m"
+)
+LOGIN_TIMEOUT_MESSAGE = (
+    f"\033[1;31mLogin page did not load after {LOGIN_ATTEMPTS} attempts. "
+    + "The VFS website might be down or blocking the bot, try again later.\033[0m"
+)
+
+
+_playwright: Optional[Playwright] = None
+_browser_context: Optional[BrowserContext] = None
+
+
+def get_launch_options() -> Dict[str, Any]:
     """
-    Abstract base class for VfsBot
+    Builds the browser launch options from the `browser` configuration section.
 
-    Provides common functionalities like login, pre-login steps, appointment checking, and notification.
-    Subclasses are responsible for implementing country-specific login and appointment checking logic.
+    Returns:
+        Dict[str, Any]: Keyword arguments for Playwright's `BrowserType.launch`
+            and `BrowserType.launch_persistent_context`.
+    """
+    headless_mode = get_config_value("browser", "headless", "True")
+    headless = str(headless_mode).lower() in ("1", "true", "yes")
+    # Window flags only make sense for a headed browser
+    return {"headless": headless, "args": [] if headless else ["--start-maximized"]}
+
+
+def get_browser_context(browser_type: str) -> BrowserContext:
+    """
+    Returns the shared persistent browser context, launching it on first use.
+
+    Playwright and the browser are started once per process and reused by
+    every subsequent bot run, so polling only pays for opening a new page.
+    The browser profile is kept on disk (`browser.profile_dir`), so cookies,
+    local storage and browsing history survive between runs and processes,
+    which lets Cloudflare Turnstile resolve without interactive challenges
+    more often. The browser is closed automatically when the interpreter exits.
+
+    Args:
+        browser_type (str): The Playwright browser type (chromium, firefox or webkit).
+
+    Returns:
+        BrowserContext: The shared persistent Playwright browser context.
+    """
+    global _playwright, _browser_context
+    if _browser_context is None:
+        # Profiles are not portable between browser engines
+        profile_dir = os.path.join(
+            get_config_value("browser", "profile_dir", ".vfs_profile"), browser_type
+        )
+        _playwright = sync_playwright().start()
+        _browser_context = getattr(_playwright, browser_type).launch_persistent_context(
+            user_data_dir=profile_dir, **get_launch_options()
+        )
+        _browser_context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        _browser_context.set_default_navigation_timeout(DEFAULT_TIMEOUT_MS)
+        blocked_resources = get_blocked_resource_types()
+        if blocked_resources:
+            _browser_context.route(
+                "**/*",
+                lambda route: (
+                    route.abort()
+                    if route.request.resource_type in blocked_resources
+                    else route.continue_()
+                ),
+            )
+        atexit.register(close_browser)
+    return _browser_context
+
+
+def close_browser() -> None:
+    """
+    Closes the shared browser context and stops Playwright, if they were started.
+    """
+    global _playwright, _browser_context
+    if _browser_context is not None:
+        _browser_context.close()
+        _browser_context = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+def get_blocked_resource_types() -> FrozenSet[str]:
+    """
+    Returns the Playwright resource types that should not be loaded.
+
+    The bot never inspects images, fonts or media, so skipping them cuts the
+    page weight of every navigation. Stylesheets are only blocked on request
+    (`stylesheet`), since visibility checks and Angular Material overlays rely
+    on them. Scripts and XHR/fetch requests must stay enabled since the
+    Cloudflare challenge depends on them.
+
+    Returns:
+        FrozenSet[str]: Resource types read from the `block_resources` browser setting.
     """
+    block_resources = get_config_value("browser", "block_resources", "image,font,media")
+    return frozenset(
+        resource.strip() for resource in block_resources.split(",") if resource.strip()
+    )
+
+
+def wait_for_any(
+    page: playwright.sync_api.Page,
+    selectors: Dict[str, str],
+    timeout: Optional[float] = None,
+) -> str:
+    """
+    Waits until an element matching any of the given selectors is visible on the page.
+
+    Each selector is restricted to visible matches and all of them are combined
+    into a single `Locator.or_` chain, so the page is polled by one wait instead
+    of one wait per selector, and hidden elements (e.g. a login form Angular keeps
+    in the DOM) never shadow a visible match of another selector.
+
+    Args:
+        page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
+        selectors (Dict[str, str]): Selectors keyed by a name identifying the page state.
+        timeout (Optional[float]): Overall time to wait in milliseconds.
+            Defaults to `DEFAULT_TIMEOUT_MS`.
+
+    Returns:
+        str: The key of the first selector (in dictionary order) with a visible match.
+
+    Raises:
+        playwright.sync_api.TimeoutError: If none of the selectors become visible in time.
+    """
+    locators = {
+        name: page.locator(f"{selector} >> visible=true").first
+        for name, selector in selectors.items()
+    }
+    any_locator = reduce(lambda left, right: left.or_(right), locators.values())
+    deadline = time.monotonic() + (timeout or DEFAULT_TIMEOUT_MS) / 1000
+    while True:
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        if remaining_ms <= 0:
+            raise PlaywrightTimeoutError(
+                f"None of {', '.join(selectors)} became visible"
+            )
+        any_locator.first.wait_for(state="visible", timeout=remaining_ms)
+        for name, locator in locators.items():
+            if locator.is_visible():
+                return name
+
+
+class VfsBotBase(ABC):
+    """
+    Common state and helpers shared by the sync `VfsBot` and the async `AsyncVfsBot`.
+
+    Holds the country codes, appointment parameter keys and page state selectors
+    of a bot, and the browser-independent steps: configuration lookups,
+    appointment parameter collection and notification.
+    """
+
+    __slots__ = (
+        "source_country_code",
+        "destination_country_code",
+        "appointment_param_keys",
+    )
+
+    # Selectors identifying the page states handled by `attempt_login`
+    cookies_selector: Optional[str] = None
+    login_selector = "#email"
+    dashboard_selector = "role=button >> text=Start New Booking"
 
     def __init__(self):
         """
@@ -36,13 +203,112 @@ class VfsBot(ABC):
         self.destination_country_code = None
         self.appointment_param_keys: List[str] = []
 
+    def get_url_key(self) -> str:
+        """
+        Returns the `<source>-<destination>` key identifying the bot's VFS site.
+        """
+        return self.source_country_code + "-" + self.destination_country_code
+
+    def get_vfs_url(self) -> Optional[str]:
+        """
+        Returns the configured VFS login URL for the bot's countries.
+        """
+        return get_config_value("vfs-url", self.get_url_key())
+
+    def get_credentials(self) -> Tuple[str, str]:
+        """
+        Returns the configured VFS email address and password.
+        """
+        return (
+            get_config_value("vfs-credential", "email"),
+            get_config_value("vfs-credential", "password"),
+        )
+
+    def get_page_state_selectors(self) -> Dict[str, str]:
+        """
+        Returns the selectors of the page states handled by `attempt_login`.
+
+        States are checked in order, so a cookie banner covering the login
+        form is handled first.
+        """
+        selectors = {"login": self.login_selector, "dashboard": self.dashboard_selector}
+        if self.cookies_selector:
+            selectors = {"cookies": self.cookies_selector, **selectors}
+        return selectors
+
+    def get_appointment_params(self, args: argparse.Namespace) -> Dict[str, str]:
+        """
+        Collects appointment parameters from command-line arguments or user input.
+
+        This method iterates through pre-defined `appointment_param_keys` (replace
+        with relevant keys) and retrieves values either from provided arguments
+        or prompts the user for input if values are missing.
+
+        Args:
+            args (argparse.Namespace): Namespace object containing parsed command-line arguments.
+
+        Returns:
+            Dict[str, str]: A dictionary containing appointment parameters.
+        """
+        provided_params = getattr(args, "appointment_params", None) or {}
+        return {
+            key: provided_params.get(key)
+            or input(f"Enter the {key.replace('_', ' ')}: ")
+            for key in self.appointment_param_keys
+        }
+
+    def notify_appointment(self, appointment_params: Dict[str, str], dates: List[str]):
+        """
+        Sends appointment dates notification to the user.
+
+        This method is responsible for notifying the appointment dates to the user configured channels
+
+        Args:
+            dates (List[str]): A list of appointment dates.
+            appointment_params (Dict[str, str]): A dictionary containing appointment search criteria.
+        """
+        message = f"Found appointment(s) for {', '.join(appointment_params.values())} on {', '.join(dates)}"
+        channels_config = get_config_value("notification", "channels", "")
+        channels = [
+            channel.strip() for channel in channels_config.split(",") if channel.strip()
+        ]
+        if len(channels) == 0:
+            logger.warning(
+                "No notification channels configured. Skipping notification."
+            )
+            return
+
+        def send(channel: str) -> None:
+            get_notification_client(channel).send_notification(message)
+
+        # Each channel is a blocking network call, so send them concurrently
+        with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+            futures = {executor.submit(send, channel): channel for channel in channels}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.error("Failed to send %s notification", futures[future])
+
+
+class VfsBot(VfsBotBase):
+    """
+    Abstract base class for VfsBot
+
+    Provides common functionalities like login, pre-login steps, appointment checking, and notification.
+    Subclasses are responsible for implementing country-specific login and appointment checking logic.
+    """
+
+    __slots__ = ()
+
     def run(self, args: argparse.Namespace = None) -> bool:
         """
         Starts the VFS bot for appointment checking and notification.
 
         This method reads configuration values, performs login, checks for
         appointments based on provided arguments, and sends notifications if
-        appointments are found.
+        appointments are found. If the browser profile still holds a valid
+        session from a previous login, the login steps are skipped.
 
         Args:
             args (argparse.Namespace, optional): Namespace object containing parsed
@@ -52,171 +318,151 @@ class VfsBot(ABC):
             bool: True if appointments were found, False otherwise.
         """
 
-        logging.info(
-            f"Starting VFS Bot for {self.source_country_code.upper()}-{self.destination_country_code.upper()}"
+        logger.info(
+            "Starting VFS Bot for %s-%s",
+            self.source_country_code.upper(),
+            self.destination_country_code.upper(),
         )
 
         # Configuration values
         try:
             browser_type = get_config_value("browser", "type", "firefox")
-            headless_mode = get_config_value("browser", "headless", "True")
-            url_key = self.source_country_code + "-" + self.destination_country_code
-            vfs_url = get_config_value("vfs-url", url_key)
+            vfs_url = self.get_vfs_url()
         except KeyError as e:
-            logging.error(f"Missing configuration value: {e}")
+            logger.error("Missing configuration value: %s", e)
             return
 
-        email_id = get_config_value("vfs-credential", "email")
-        password = get_config_value("vfs-credential", "password")
+        email_id, password = self.get_credentials()
 
         appointment_params = self.get_appointment_params(args)
 
-        # Launch browser and perform actions
-        with sync_playwright() as p:
-            browser = getattr(p, browser_type).launch(
-                headless=False,
-                args=["--start-maximized"]
-            )
-
-            # context = browser.new_context(
-            # user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
-            # locale="en-US"
-            # )
-            # context.add_init_script("""Object.defineProperty(navigator, 'webdriver', {get: () => undefined})""")
-
-            page = browser.new_page()
-            logging.info("New page created")
-
-            
-            # stealth_sync(page)
-            # page.add_init_script("window.opts = {};")
-
-            # page.on("console", lambda msg: print(f"Console log: {msg.type}: {msg.text}"))
-
-            # logging.info("Trying 2Captcha API")
-            # captcha_api_key = get_config_value("captcha", "api_key")
-            # solver = TwoCaptcha(captcha_api_key)
-            # result = solver.turnstile(sitekey='0x4AAAAAAACYaM3U_Dz-4DN1', url=vfs_url)
-
-            # logging.info("2Captcha API result")
-            # logging.info(result)
-
-            # captcha_token = result['code']
-            # logging.info("Captcha token received successfully")
+        # Reuse the shared persistent context; each run gets its own page
+        context = get_browser_context(browser_type)
+        page = context.new_page()
+        try:
+            logger.debug("New page created")
 
             page.goto(vfs_url)
 
-            page.wait_for_selector('div[appcloudflarerecaptcha]', timeout=300000)
-            logging.info("Cloudflare challenge detected")
-
-            # page.wait_for_timeout(500)
-
-            # logging.info("Waiting for captcha token selector")
-            # page.wait_for_selector('[name="cf-turnstile-response"]')
-            # logging.info("Captcha token selector found")
-
-            # page.evaluate(f'document.getElementsByName("cf-turnstile-response")[0].value="{captcha_token}";')
-            # logging.info("Cloudflare Captcha token set!!")
-
-            # page.wait_for_timeout(8000)
-            # page.wait_for_selector('[name="cf-turnstile-response"]')
-            # logging.info("Captcha token selector found")
-
-            # if result and 'code' in result:
-            #     captcha_token = result['code']
-            #     # logging.info("captcha_token: ", captcha_token)
-            #     page.evaluate(f'document.getElementsByName("cf-turnstile-response")[0].value="{captcha_token}";')
-            #     logging.info("Captcha token set")
-          
-            page.wait_for_timeout(5000)
-
-            logging.info("Trying pre login steps")
-            self.pre_login_steps(page)
-
-            page.wait_for_timeout(5000)
-
-            logging.info("Trying login")
-            try:
-                self.login(page, email_id, password)
-                logging.info("Logged in successfully")
-            except Exception:
-                browser.close()
-                raise LoginError(
-                    "\033[1;31mLogin failed. "
-                    + "Please verify your username and password by logging in to the browser and try again.\033[0m"
-                )
+            self.perform_login(page, email_id, password)
 
-            logging.info(f"Checking appointments for {appointment_params}")
+            logger.info("Checking appointments for %s", appointment_params)
             appointment_found = False
             try:
                 dates = self.check_for_appontment(page, appointment_params)
                 if dates:
                     # Log successful appointment finding
-                    logging.info(
-                        f"\033[1;32mFound appointments on: {', '.join(dates)} \033[0m"
+                    logger.info(
+                        "\033[1;32mFound appointments on: %s \033[0m", ", ".join(dates)
                     )
                     self.notify_appointment(appointment_params, dates)
                     appointment_found = True
                 else:
                     # Log no appointments found
-                    logging.info(
+                    logger.info(
                         "\033[1;33mNo appointments found for the specified criteria.\033[0m"
                     )
             except Exception as e:
-                logging.error(f"Appointment check failed: {e}")
-            browser.close()
+                logger.error("Appointment check failed: %s", e)
             return appointment_found
-
-    def get_appointment_params(self, args: argparse.Namespace) -> Dict[str, str]:
+        finally:
+            page.close()
+
+    def perform_login(
+        self,
+        page: playwright.sync_api.Page,
+        email_id: str,
+        password: str,
+    ) -> None:
         """
-        Collects appointment parameters from command-line arguments or user input.
+        Brings the current page to the post-login dashboard, logging in if required.
 
-        This method iterates through pre-defined `appointment_param_keys` (replace
-        with relevant keys) and retrieves values either from provided arguments
-        or prompts the user for input if values are missing.
+        Attempts that time out before the login form is submitted (e.g. a stuck
+        Cloudflare challenge, a slow login form or a late cookie banner) are
+        retried on the same page after a reload, backing off exponentially
+        between attempts, so they do not require restarting the browser. A
+        submitted login that does not reach the dashboard is never retried, as
+        repeated login requests get the VFS account blocked.
 
         Args:
-            args (argparse.Namespace): Namespace object containing parsed command-line arguments.
+            page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
 
-        Returns:
-            Dict[str, str]: A dictionary containing appointment parameters.
+        Raises:
+            LoginError: If the login is rejected or every attempt times out.
         """
-        appointment_params = {}
-        for key in self.appointment_param_keys:
-            if (
-                getattr(args, "appointment_params") is not None
-                and args.appointment_params[key] is not None
-            ):
-                appointment_params[key] = args.appointment_params[key]
-            else:
-                key_name = key.replace("_", " ")
-                appointment_params[key] = input(f"Enter the {key_name}: ")
-        return appointment_params
+        for attempt in range(1, LOGIN_ATTEMPTS + 1):
+            try:
+                if attempt > 1:
+                    page.reload()
+                if self.attempt_login(page, email_id, password):
+                    logger.info("Logged in successfully")
+                else:
+                    logger.info("Reusing saved session, skipping login")
+                return
+            except PlaywrightTimeoutError as e:
+                logger.warning(
+                    "Login attempt %s of %s timed out: %s", attempt, LOGIN_ATTEMPTS, e
+                )
+                if attempt < LOGIN_ATTEMPTS:
+                    time.sleep(2**attempt)
 
-    def notify_appointment(self, appointment_params: Dict[str, str], dates: List[str]):
+        raise LoginError(LOGIN_TIMEOUT_MESSAGE)
+
+    def attempt_login(
+        self, page: playwright.sync_api.Page, email_id: str, password: str
+    ) -> bool:
         """
-        Sends appointment dates notification to the user.
+        Performs a single pass of the pre-login and login steps.
 
-        This method is responsible for notifying the appointment dates to the user configured channels
+        Instead of running every step blindly, this waits once for whichever of
+        the cookie banner, the login form or the dashboard shows up first and
+        dispatches to `pre_login_steps` or `login` accordingly, until the
+        dashboard is reached. Steps that the page skips (e.g. cookies already
+        accepted, session still valid) cost nothing.
+
+        Timeouts raised by `login` happen before the form is submitted and are
+        passed on to `perform_login` to be retried. Once the form is submitted,
+        any failure to reach the dashboard is a `LoginError`.
 
         Args:
-            dates (List[str]): A list of appointment dates.
-            appointment_params (Dict[str, str]): A dictionary containing appointment search criteria.
+            page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
+
+        Returns:
+            bool: True if a login was performed, False if the session was already logged in.
+
+        Raises:
+            LoginError: If the login fails or the submitted login does not reach
+                the dashboard.
+            playwright.sync_api.TimeoutError: If the page does not reach a known state
+                in time before the login form is submitted.
         """
-        message = f"Found appointment(s) for {', '.join(appointment_params.values())} on {', '.join(dates)}"
-        channels = get_config_value("notification", "channels")
-        if len(channels) == 0:
-            logging.warning(
-                "No notification channels configured. Skipping notification."
-            )
-            return
+        selectors = self.get_page_state_selectors()
+        while True:
+            state = wait_for_any(page, selectors)
+            logger.debug("Page state: %s", state)
+            if state == "dashboard":
+                return False
+            if state == "cookies":
+                self.pre_login_steps(page)
+                del selectors["cookies"]
+                continue
 
-        for channel in channels.split(","):
-            client = get_notification_client(channel)
             try:
-                client.send_notification(message)
-            except Exception:
-                logging.error(f"Failed to send {channel} notification")
+                self.login(page, email_id, password)
+            except PlaywrightTimeoutError:
+                # Nothing was submitted yet, let perform_login retry
+                raise
+            except Exception as e:
+                raise LoginError(LOGIN_FAILED_MESSAGE) from e
+            try:
+                page.wait_for_selector(self.dashboard_selector)
+            except PlaywrightTimeoutError as e:
+                raise LoginError(LOGIN_FAILED_MESSAGE) from e
+            return True
 
     @abstractmethod
     def login(
@@ -227,8 +473,8 @@ class VfsBot(ABC):
 
         This abstract method needs to be implemented by subclasses to handle
         country-specific login procedures (e.g., filling login form elements, handling
-        CAPTCHAs). It should interact with the Playwright `page` object to achieve
-        login functionality.
+        CAPTCHAs). It should interact with the Playwright `page` object and end by
+        submitting the login form; waiting for the dashboard is left to `attempt_login`.
 
         Args:
             page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
@@ -236,9 +482,9 @@ class VfsBot(ABC):
             password (str): The user's password for VFS login.
 
         Raises:
+            playwright.sync_api.TimeoutError: If the login form is not ready in time.
             Exception: If login fails due to unexpected errors.
         """
-        raise NotImplementedError("Subclasses must implement login logic")
 
     @abstractmethod
     def pre_login_steps(self, page: playwright.sync_api.Page) -> None:
@@ -272,6 +518,3 @@ class VfsBot(ABC):
         Returns:
             List[str]: A list of available appointment dates (empty list if none found).
         """
-        raise NotImplementedError(
-            "Subclasses must implement appointment checking logic"
-        )
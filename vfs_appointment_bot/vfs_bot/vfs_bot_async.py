@@ -0,0 +1,399 @@
+import argparse
+import asyncio
+import logging
+import os
+import time
+from abc import abstractmethod
+from functools import reduce
+from typing import Dict, List, Optional, Sequence
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from vfs_appointment_bot.utils.config_reader import get_config_value
+from vfs_appointment_bot.utils.timer import countdown
+from vfs_appointment_bot.vfs_bot.vfs_bot import (
+    DEFAULT_TIMEOUT_MS,
+    LOGIN_ATTEMPTS,
+    LOGIN_FAILED_MESSAGE,
+    LOGIN_TIMEOUT_MESSAGE,
+    LoginError,
+    VfsBotBase,
+    get_blocked_resource_types,
+    get_launch_options,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_for_any(
+    page: Page, selectors: Dict[str, str], timeout: Optional[float] = None
+) -> str:
+    """
+    Async counterpart of `vfs_bot.wait_for_any`.
+
+    Args:
+        page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+        selectors (Dict[str, str]): Selectors keyed by a name identifying the page state.
+        timeout (Optional[float]): Overall time to wait in milliseconds.
+            Defaults to `DEFAULT_TIMEOUT_MS`.
+
+    Returns:
+        str: The key of the first selector (in dictionary order) with a visible match.
+
+    Raises:
+        playwright.async_api.TimeoutError: If none of the selectors become visible in time.
+    """
+    locators = {
+        name: page.locator(f"{selector} >> visible=true").first
+        for name, selector in selectors.items()
+    }
+    any_locator = reduce(lambda left, right: left.or_(right), locators.values())
+    deadline = time.monotonic() + (timeout or DEFAULT_TIMEOUT_MS) / 1000
+    while True:
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        if remaining_ms <= 0:
+            raise PlaywrightTimeoutError(
+                f"None of {', '.join(selectors)} became visible"
+            )
+        await any_locator.first.wait_for(state="visible", timeout=remaining_ms)
+        for name, locator in locators.items():
+            if await locator.is_visible():
+                return name
+
+
+class AsyncVfsBot(VfsBotBase):
+    """
+    Abstract base class for VfsBot implementations built on Playwright's async API.
+
+    Async bots share a single browser and check for appointments concurrently on
+    one event loop (see `poll_bots`), so checking N countries takes roughly as
+    long as the slowest check instead of the sum of all of them. The login flow
+    mirrors `VfsBot`; subclasses implement the `login`, `pre_login_steps` and
+    `check_for_appontment` coroutines.
+    """
+
+    __slots__ = ()
+
+    async def run_async(
+        self, browser: Browser, appointment_params: Dict[str, str]
+    ) -> bool:
+        """
+        Checks for appointments in a new context of the shared async browser.
+
+        The context is seeded with the site's saved session, if still fresh, and
+        the session is saved again once the dashboard is reached. A rejected
+        login discards the saved session.
+
+        Args:
+            browser (playwright.async_api.Browser): The shared Playwright browser.
+            appointment_params (Dict[str, str]): A dictionary containing appointment search criteria.
+
+        Returns:
+            bool: True if appointments were found, False otherwise.
+        """
+        logger.info(
+            "Starting VFS Bot for %s-%s",
+            self.source_country_code.upper(),
+            self.destination_country_code.upper(),
+        )
+
+        vfs_url = self.get_vfs_url()
+        email_id, password = self.get_credentials()
+
+        state_path = self.get_storage_state_path()
+        context = await self.new_browser_context(browser)
+        try:
+            page = await context.new_page()
+            await page.goto(vfs_url)
+
+            try:
+                await self.perform_login(page, email_id, password)
+            except LoginError:
+                if os.path.exists(state_path):
+                    os.remove(state_path)
+                raise
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+            await context.storage_state(path=state_path)
+
+            logger.info("Checking appointments for %s", appointment_params)
+            appointment_found = False
+            try:
+                dates = await self.check_for_appontment(page, appointment_params)
+                if dates:
+                    logger.info(
+                        "\033[1;32mFound appointments on: %s \033[0m", ", ".join(dates)
+                    )
+                    # Notification clients are blocking, keep them off the event loop
+                    await asyncio.to_thread(
+                        self.notify_appointment, appointment_params, dates
+                    )
+                    appointment_found = True
+                else:
+                    logger.info(
+                        "\033[1;33mNo appointments found for the specified criteria.\033[0m"
+                    )
+            except Exception as e:
+                logger.error("Appointment check failed: %s", e)
+            return appointment_found
+        finally:
+            await context.close()
+
+    async def new_browser_context(self, browser: Browser) -> BrowserContext:
+        """
+        Creates a browser context for a single check, set up like the sync bot's one.
+
+        The context restores the site's saved session if it is still fresh, and
+        uses the same timeouts and resource blocking as `vfs_bot.get_browser_context`.
+
+        Args:
+            browser (playwright.async_api.Browser): The shared Playwright browser.
+
+        Returns:
+            playwright.async_api.BrowserContext: The new browser context.
+        """
+        context = await browser.new_context(
+            storage_state=(
+                self.get_storage_state_path()
+                if self.has_fresh_storage_state()
+                else None
+            )
+        )
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        context.set_default_navigation_timeout(DEFAULT_TIMEOUT_MS)
+        blocked_resources = get_blocked_resource_types()
+        if blocked_resources:
+
+            async def block_resources(route: Route) -> None:
+                if route.request.resource_type in blocked_resources:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", block_resources)
+        return context
+
+    def get_storage_state_path(self) -> str:
+        """
+        Returns the path of the saved session (cookies and local storage) for the bot's site.
+
+        Async checks run in short-lived browser contexts, so the session is
+        saved after each successful login and restored into the next context,
+        which then lands directly on the dashboard instead of logging in again.
+
+        Returns:
+            str: The storage state file path under `browser.state_dir`
+                (`.vfs_state` if unset or empty).
+        """
+        state_dir = get_config_value("browser", "state_dir") or ".vfs_state"
+        return os.path.join(state_dir, f"{self.get_url_key()}.json")
+
+    def has_fresh_storage_state(self) -> bool:
+        """
+        Checks whether a saved session exists and is younger than `browser.session_ttl` seconds.
+
+        Returns:
+            bool: True if the saved session should be restored, False otherwise.
+        """
+        state_path = self.get_storage_state_path()
+        session_ttl = int(get_config_value("browser", "session_ttl", "1800"))
+        return (
+            os.path.exists(state_path)
+            and time.time() - os.path.getmtime(state_path) < session_ttl
+        )
+
+    async def perform_login(self, page: Page, email_id: str, password: str) -> None:
+        """
+        Brings the current page to the post-login dashboard, logging in if required.
+
+        Same retry policy as `VfsBot.perform_login`: only timeouts before the
+        login form is submitted are retried, after a reload and an exponential
+        back-off.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
+
+        Raises:
+            LoginError: If the login is rejected or every attempt times out.
+        """
+        for attempt in range(1, LOGIN_ATTEMPTS + 1):
+            try:
+                if attempt > 1:
+                    await page.reload()
+                if await self.attempt_login(page, email_id, password):
+                    logger.info("Logged in successfully for %s", self.get_url_key())
+                else:
+                    logger.info("Reusing saved session for %s", self.get_url_key())
+                return
+            except PlaywrightTimeoutError as e:
+                logger.warning(
+                    "Login attempt %s of %s for %s timed out: %s",
+                    attempt,
+                    LOGIN_ATTEMPTS,
+                    self.get_url_key(),
+                    e,
+                )
+                if attempt < LOGIN_ATTEMPTS:
+                    await asyncio.sleep(2**attempt)
+
+        raise LoginError(LOGIN_TIMEOUT_MESSAGE)
+
+    async def attempt_login(self, page: Page, email_id: str, password: str) -> bool:
+        """
+        Performs a single pass of the pre-login and login steps.
+
+        Same state machine as `VfsBot.attempt_login`: timeouts raised by `login`
+        are retried by `perform_login`, failures after the form is submitted are not.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
+
+        Returns:
+            bool: True if a login was performed, False if the session was already logged in.
+
+        Raises:
+            LoginError: If the login fails or the submitted login does not reach
+                the dashboard.
+            playwright.async_api.TimeoutError: If the page does not reach a known state
+                in time before the login form is submitted.
+        """
+        selectors = self.get_page_state_selectors()
+        while True:
+            state = await wait_for_any(page, selectors)
+            logger.debug("Page state for %s: %s", self.get_url_key(), state)
+            if state == "dashboard":
+                return False
+            if state == "cookies":
+                await self.pre_login_steps(page)
+                del selectors["cookies"]
+                continue
+
+            try:
+                await self.login(page, email_id, password)
+            except PlaywrightTimeoutError:
+                # Nothing was submitted yet, let perform_login retry
+                raise
+            except Exception as e:
+                raise LoginError(LOGIN_FAILED_MESSAGE) from e
+            try:
+                await page.wait_for_selector(self.dashboard_selector)
+            except PlaywrightTimeoutError as e:
+                raise LoginError(LOGIN_FAILED_MESSAGE) from e
+            return True
+
+    @abstractmethod
+    async def login(self, page: Page, email_id: str, password: str) -> None:
+        """
+        Performs login steps specific to the VFS website for the bot's country,
+        ending with the submission of the login form.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
+
+        Raises:
+            playwright.async_api.TimeoutError: If the login form is not ready in time.
+            Exception: If login fails due to unexpected errors.
+        """
+
+    @abstractmethod
+    async def pre_login_steps(self, page: Page) -> None:
+        """
+        Performs any pre-login steps required by the VFS website for the bot's country.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+        """
+
+    @abstractmethod
+    async def check_for_appontment(
+        self, page: Page, appointment_params: Dict[str, str]
+    ) -> List[str]:
+        """
+        Checks for appointments based on provided parameters on the VFS website.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            appointment_params (Dict[str, str]): A dictionary containing appointment search criteria.
+
+        Returns:
+            List[str]: A list of available appointment dates (empty list if none found).
+        """
+
+
+async def poll_bots(
+    bots: Sequence[AsyncVfsBot], bot_args: Sequence[argparse.Namespace]
+) -> None:
+    """
+    Checks several bots concurrently until each of them has found an appointment.
+
+    Playwright and the browser are started once and reused by every check; each
+    bot gets its own browser context per check and all checks of a round run
+    concurrently with `asyncio.gather`. Appointment parameters are collected for
+    every bot up front, since they may prompt for user input.
+
+    Each bot is checked independently: a failed check (e.g. a network error or
+    a login timeout) is logged and retried in the next round, while a bot whose
+    login is rejected is dropped without affecting the others.
+
+    This must not be mixed with the sync API (`VfsBot.run`) in the same thread.
+
+    Args:
+        bots (Sequence[AsyncVfsBot]): The bots to run.
+        bot_args (Sequence[argparse.Namespace]): Parsed command-line arguments for
+            each bot, in the same order.
+    """
+    pending = []
+    for bot, args in zip(bots, bot_args):
+        logger.info("Appointment parameters for %s", bot.get_url_key())
+        pending.append((bot, bot.get_appointment_params(args)))
+
+    interval = int(get_config_value("default", "interval"))
+    browser_type = get_config_value("browser", "type", "firefox")
+
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_type).launch(**get_launch_options())
+        try:
+            while True:
+                results = await asyncio.gather(
+                    *(bot.run_async(browser, params) for bot, params in pending),
+                    return_exceptions=True,
+                )
+
+                remaining = []
+                for (bot, params), result in zip(pending, results):
+                    if isinstance(result, LoginError):
+                        # Retrying would only get the VFS account blocked
+                        logger.error(
+                            "Stopped checking %s: %s", bot.get_url_key(), result
+                        )
+                    elif isinstance(result, Exception):
+                        logger.error(
+                            "Appointment check for %s failed: %s",
+                            bot.get_url_key(),
+                            result,
+                        )
+                        remaining.append((bot, params))
+                    elif isinstance(result, BaseException):
+                        raise result
+                    elif not result:
+                        remaining.append((bot, params))
+                pending = remaining
+                if not pending:
+                    return
+                await asyncio.to_thread(
+                    countdown, interval, "Next appointment check in"
+                )
+        finally:
+            await browser.close()
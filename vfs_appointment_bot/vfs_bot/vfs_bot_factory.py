@@ -1,4 +1,5 @@
 from vfs_appointment_bot.vfs_bot.vfs_bot import VfsBot
+from vfs_appointment_bot.vfs_bot.vfs_bot_async import AsyncVfsBot
 
 
 class UnsupportedCountryError(Exception):
@@ -44,3 +45,37 @@ def get_vfs_bot(source_country_code: str, destination_country_code: str) -> VfsB
         raise UnsupportedCountryError(
             f"Country {destination_country_code} is not supported"
         )
+
+
+def get_async_vfs_bot(
+    source_country_code: str, destination_country_code: str
+) -> AsyncVfsBot:
+    """Retrieves the appropriate AsyncVfsBot class for a given country.
+
+    Async bots are used to check several countries concurrently. Only the
+    countries listed below have an async implementation so far.
+
+    Args:
+        source_country_code (str): The ISO 3166-1 alpha-2 country code where you're applying from.
+        destination_country_code (str): The ISO 3166-1 alpha-2 country code where the appointment is needed.
+
+    Returns:
+        AsyncVfsBot: An instance of the `AsyncVfsBot` subclass specific to the provided country.
+
+    Raises:
+        UnsupportedCountryError: If the provided country is not supported for concurrent checks.
+    """
+
+    if source_country_code == "GB" and destination_country_code == "IT":
+        from .vfs_bot_uk2it_async import AsyncVfsBotUk2It
+
+        return AsyncVfsBotUk2It(source_country_code)
+    elif destination_country_code == "NL":
+        from .vfs_bot_nl_async import AsyncVfsBotNl
+
+        return AsyncVfsBotNl(source_country_code)
+    else:
+        raise UnsupportedCountryError(
+            f"Checking {source_country_code}-{destination_country_code} together with "
+            + "other countries is not supported"
+        )
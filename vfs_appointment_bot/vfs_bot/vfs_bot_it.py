@@ -6,6 +6,8 @@ from playwright.sync_api import Page
 from vfs_appointment_bot.utils.date_utils import extract_date_from_string
 from vfs_appointment_bot.vfs_bot.vfs_bot import VfsBot
 
+logger = logging.getLogger(__name__)
+
 
 class VfsBotIt(VfsBot):
     """Concrete implementation of VfsBot for Italy (IT).
@@ -20,6 +22,11 @@ class VfsBotIt(VfsBot):
         parameters and extracts available dates from the website.
     """
 
+    __slots__ = ()
+
+    cookies_selector = "role=button[name='Reject All']"
+    login_selector = "#mat-input-0"
+
     def __init__(self, source_country_code: str):
         """
         Initializes a VfsBotIt instance for Italy.
@@ -48,8 +55,7 @@ class VfsBotIt(VfsBot):
         Performs login steps specific to the Italy VFS website.
 
         This method fills the email and password input fields on the login form
-        and clicks the "Sign In" button. It raises an exception if the login fails
-        (e.g., if the "Start New Booking" button is not found after login).
+        and clicks the "Sign In" button.
 
         Args:
             page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
@@ -57,7 +63,7 @@ class VfsBotIt(VfsBot):
             password (str): The user's password for VFS login.
 
         Raises:
-            Exception: If login fails due to unexpected errors or missing "Start New Booking" button.
+            Exception: If login fails due to unexpected errors.
         """
         email_input = page.locator("#mat-input-0")
         password_input = page.locator("#mat-input-1")
@@ -66,7 +72,6 @@ class VfsBotIt(VfsBot):
         password_input.fill(password)
 
         page.get_by_role("button", name="Sign In").click()
-        page.wait_for_selector("role=button >> text=Start New Booking")
 
     def pre_login_steps(self, page: Page) -> None:
         """
@@ -81,7 +86,7 @@ class VfsBotIt(VfsBot):
         policies_reject_button = page.get_by_role("button", name="Reject All")
         if policies_reject_button is not None:
             policies_reject_button.click()
-            logging.debug("Rejected all cookie policies")
+            logger.debug("Rejected all cookie policies")
 
     def check_for_appontment(
         self, page: Page, appointment_params: Dict[str, str]
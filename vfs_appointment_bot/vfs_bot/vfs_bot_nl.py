@@ -1,4 +1,5 @@
 import logging
+import random
 from typing import Dict, List, Optional
 
 from playwright.sync_api import Page
@@ -6,12 +7,33 @@ from playwright.sync_api import Page
 from vfs_appointment_bot.utils.date_utils import extract_date_from_string
 from vfs_appointment_bot.vfs_bot.vfs_bot import VfsBot
 
+logger = logging.getLogger(__name__)
 
-class VfsBotNl(VfsBot):
+
+class VfsBotNlMixin:
     """
-    VFS bot implementation for Netherlands visa applications via Dublin, Ireland.
+    Selectors and settings of the Netherlands VFS website via Dublin, Ireland.
+
+    Shared by the sync (`VfsBotNl`) and async (`AsyncVfsBotNl`) bots, so that
+    both drive the same page elements.
     """
 
+    __slots__ = ()
+
+    _EMAIL_SELECTOR = "#email"
+    _PASSWORD_SELECTOR = "#password"
+    _SIGN_IN_BUTTON = "Sign In"
+    _COOKIES_BUTTON = "Accept Only Necessary"
+    _START_BOOKING_BUTTON = "Start New Booking"
+    _CONTINUE_BUTTON = "Continue"
+    _VISA_CENTER_LABEL = "Visa Application Centre"
+    _VISA_CATEGORY_LABEL = "Visa Category"
+    _VISA_SUB_CATEGORY_LABEL = "Visa Sub Category"
+    _DATES_SELECTOR = ".date-available"
+
+    cookies_selector = f"role=button[name='{_COOKIES_BUTTON}']"
+    login_selector = _EMAIL_SELECTOR
+
     def __init__(self, source_country_code: str):
         super().__init__()
         self.source_country_code = source_country_code
@@ -22,6 +44,14 @@ class VfsBotNl(VfsBot):
             "visa_sub_category"
         ]
 
+
+class VfsBotNl(VfsBotNlMixin, VfsBot):
+    """
+    VFS bot implementation for Netherlands visa applications via Dublin, Ireland.
+    """
+
+    __slots__ = ()
+
     def login(self, page: Page, email_id: str, password: str) -> None:
         """
         Performs login steps specific to the Netherlands VFS website.
@@ -35,39 +65,20 @@ class VfsBotNl(VfsBot):
             Exception: If login fails due to unexpected errors or missing elements.
         """
 
-        # Wait for login form elements
-        try:
-            page.wait_for_selector("#email", timeout=30000)
-            logging.info("Email input found")
-            page.wait_for_selector("#password", timeout=30000)
-            logging.info("Password input found")
-            
-        except Exception as e:
-            logging.error("Login form elements not found after waiting")
-            raise Exception("Login form elements not found. The page might be stuck in a loading state.")
+        # The login form is already visible here (see `attempt_login`), so
+        # fill() only auto-waits for each input to be actionable
+        email_input = page.locator(self._EMAIL_SELECTOR)
+        password_input = page.locator(self._PASSWORD_SELECTOR)
 
-        
-        # Add small delays between actions to appear more human-like
-        page.wait_for_timeout(1000)
-        
         # Fill in the login form
-        email_input = page.locator("#email")
-        password_input = page.locator("#password")
-
         email_input.fill(email_id)
-        page.wait_for_timeout(500)
         password_input.fill(password)
-        page.wait_for_timeout(1000)
+
+        # Single short random pause to appear more human-like
+        page.wait_for_timeout(random.uniform(200, 600))
 
         # Click the login button
-        page.get_by_role("button", name="Sign In").click()
-        
-        # Wait for successful login by checking for the "Start New Booking" button
-        try:
-            page.wait_for_selector("role=button >> text=Start New Booking", timeout=30000)
-        except Exception as e:
-            logging.error("Failed to find 'Start New Booking' button after login")
-            raise Exception("Login might have failed or the page is stuck in a loading state.")
+        page.get_by_role("button", name=self._SIGN_IN_BUTTON).click()
 
     def pre_login_steps(self, page: Page) -> None:
         """
@@ -77,10 +88,10 @@ class VfsBotNl(VfsBot):
             page (playwright.sync_api.Page): The Playwright page object used for browser interaction.
         """
         # Handle cookie policies if they appear
-        policies_reject_button = page.get_by_role("button", name="Accept Only Necessary")
+        policies_reject_button = page.get_by_role("button", name=self._COOKIES_BUTTON)
         if policies_reject_button is not None:
             policies_reject_button.click()
-            logging.debug("Rejected all cookie policies")
+            logger.debug("Rejected all cookie policies")
 
     def check_for_appontment(
         self, page: Page, appointment_params: Dict[str, str]
@@ -97,29 +108,29 @@ class VfsBotNl(VfsBot):
         """
         try:
             # Click Start New Booking button
-            page.get_by_role("button", name="Start New Booking").click()
+            page.get_by_role("button", name=self._START_BOOKING_BUTTON).click()
             
             # Select visa center
-            page.get_by_label("Visa Application Centre").select_option(
+            page.get_by_label(self._VISA_CENTER_LABEL).select_option(
                 appointment_params["visa_center"]
             )
             
             # Select visa category
-            page.get_by_label("Visa Category").select_option(
+            page.get_by_label(self._VISA_CATEGORY_LABEL).select_option(
                 appointment_params["visa_category"]
             )
             
             # Select visa subcategory
-            page.get_by_label("Visa Sub Category").select_option(
+            page.get_by_label(self._VISA_SUB_CATEGORY_LABEL).select_option(
                 appointment_params["visa_sub_category"]
             )
             
             
             # Click continue and wait for available dates
-            page.get_by_role("button", name="Continue").click()
+            page.get_by_role("button", name=self._CONTINUE_BUTTON).click()
             
             # Wait for and extract available dates
-            dates_element = page.wait_for_selector(".date-available")
+            dates_element = page.wait_for_selector(self._DATES_SELECTOR)
             if dates_element:
                 dates_text = dates_element.inner_text()
                 return extract_date_from_string(dates_text)
@@ -127,5 +138,5 @@ class VfsBotNl(VfsBot):
             return None
             
         except Exception as e:
-            logging.error(f"Error checking for appointments: {str(e)}")
+            logger.error("Error checking for appointments: %s", e)
             return None 
\ No newline at end of file
@@ -0,0 +1,98 @@
+import logging
+import random
+from typing import Dict, List, Optional
+
+from playwright.async_api import Page
+
+from vfs_appointment_bot.utils.date_utils import extract_date_from_string
+from vfs_appointment_bot.vfs_bot.vfs_bot_async import AsyncVfsBot
+from vfs_appointment_bot.vfs_bot.vfs_bot_nl import VfsBotNlMixin
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVfsBotNl(VfsBotNlMixin, AsyncVfsBot):
+    """
+    Async VFS bot implementation for Netherlands visa applications via Dublin, Ireland.
+
+    Mirrors `VfsBotNl` on Playwright's async API, for concurrent checks.
+    """
+
+    __slots__ = ()
+
+    async def login(self, page: Page, email_id: str, password: str) -> None:
+        """
+        Performs login steps specific to the Netherlands VFS website.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            email_id (str): The user's email address for VFS login.
+            password (str): The user's password for VFS login.
+
+        Raises:
+            Exception: If login fails due to unexpected errors or missing elements.
+        """
+        # The login form is already visible here (see `attempt_login`)
+        email_input = page.locator(self._EMAIL_SELECTOR)
+        password_input = page.locator(self._PASSWORD_SELECTOR)
+
+        await email_input.fill(email_id)
+        await password_input.fill(password)
+
+        # Single short random pause to appear more human-like
+        await page.wait_for_timeout(random.uniform(200, 600))
+
+        await page.get_by_role("button", name=self._SIGN_IN_BUTTON).click()
+
+    async def pre_login_steps(self, page: Page) -> None:
+        """
+        Performs pre-login steps specific to the Netherlands VFS website.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+        """
+        await page.get_by_role("button", name=self._COOKIES_BUTTON).click()
+        logger.debug("Rejected all cookie policies")
+
+    async def check_for_appontment(
+        self, page: Page, appointment_params: Dict[str, str]
+    ) -> Optional[List[str]]:
+        """
+        Checks for appointments on the Netherlands VFS website based on provided parameters.
+
+        Args:
+            page (playwright.async_api.Page): The Playwright page object used for browser interaction.
+            appointment_params (Dict[str, str]): A dictionary containing appointment search criteria.
+
+        Returns:
+            Optional[List[str]]: List of available appointment dates if found, None otherwise.
+        """
+        try:
+            await page.get_by_role("button", name=self._START_BOOKING_BUTTON).click()
+
+            await page.get_by_label(self._VISA_CENTER_LABEL).select_option(
+                appointment_params["visa_center"]
+            )
+            await page.get_by_label(self._VISA_CATEGORY_LABEL).select_option(
+                appointment_params["visa_category"]
+            )
+            await page.get_by_label(self._VISA_SUB_CATEGORY_LABEL).select_option(
+                appointment_params["visa_sub_category"]
+            )
+
+            # Click continue and wait for available dates
+            await page.get_by_role("button", name=self._CONTINUE_BUTTON).click()
+
+            dates_element = await page.wait_for_selector(self._DATES_SELECTOR)
+            if dates_element:
+                appointment_date = extract_date_from_string(
+                    await dates_element.inner_text()
+                )
+                if appointment_date:
+                    return [appointment_date]
+
+            return None
+
+        except Exception as e:
+            logger.error("Error checking for appointments: %s", e)
+            return None
@@ -1,4 +1,5 @@
 import logging
+import random
 from typing import Dict, List, Optional
 
 from playwright.sync_api import Page
@@ -6,12 +7,18 @@ from playwright.sync_api import Page
 from vfs_appointment_bot.utils.date_utils import extract_date_from_string
 from vfs_appointment_bot.vfs_bot.vfs_bot import VfsBot
 
+logger = logging.getLogger(__name__)
+
 
 class VfsBotUk2It(VfsBot):
     """
     VFS bot implementation for Italy visa applications via London, UK.
     """
 
+    __slots__ = ()
+
+    cookies_selector = "role=button[name='Accept Only Necessary']"
+
     def __init__(self, source_country_code: str):
         super().__init__()
         self.source_country_code = source_country_code
@@ -35,39 +42,19 @@ class VfsBotUk2It(VfsBot):
             Exception: If login fails due to unexpected errors or missing elements.
         """
 
-        # Wait for login form elements
-        try:
-            page.wait_for_selector("#email", timeout=30000)
-            logging.info("Email input found")
-            page.wait_for_selector("#password", timeout=30000)
-            logging.info("Password input found")
-            
-        except Exception as e:
-            logging.error("Login form elements not found after waiting")
-            raise Exception("Login form elements not found. The page might be stuck in a loading state.")
-
-        
-        # Add small delays between actions to appear more human-like
-        page.wait_for_timeout(1000)
-        
-        # Fill in the login form
+        # The login form is already visible here (see `attempt_login`), and
+        # fill() auto-waits for the inputs to be actionable
         email_input = page.locator("#email")
         password_input = page.locator("#password")
 
         email_input.fill(email_id)
-        page.wait_for_timeout(500)
         password_input.fill(password)
-        page.wait_for_timeout(1000)
+
+        # Single short random pause to appear more human-like
+        page.wait_for_timeout(random.uniform(200, 600))
 
         # Click the login button
         page.get_by_role("button", name="Sign In").click()
-        
-        # Wait for successful login by checking for the "Start New Booking" button
-        try:
-            page.wait_for_selector("role=button >> text=Start New Booking", timeout=30000)
-        except Exception as e:
-            logging.error("Failed to find 'Start New Booking' button after login")
-            raise Exception("Login might have failed or the page is stuck in a loading state.")
 
     def pre_login_steps(self, page: Page) -> None:
         """
@@ -80,7 +67,7 @@ class VfsBotUk2It(VfsBot):
         policies_reject_button = page.get_by_role("button", name="Accept Only Necessary")
         if policies_reject_button is not None:
             policies_reject_button.click()
-            logging.debug("Rejected all cookie policies")
+            logger.debug("Rejected all cookie policies")
 
     def check_for_appontment(
         self, page: Page, appointment_params: Dict[str, str]
@@ -127,5 +114,5 @@ class VfsBotUk2It(VfsBot):
             return None
             
         except Exception as e:
-            logging.error(f"Error checking for appointments: {str(e)}")
+            logger.error("Error checking for appointments: %s", e)
             return None 
\ No newline at end of file
@@ -0,0 +1,16 @@
+from vfs_appointment_bot.vfs_bot.vfs_bot_nl_async import AsyncVfsBotNl
+
+
+class AsyncVfsBotUk2It(AsyncVfsBotNl):
+    """
+    Async VFS bot implementation for Italy visa applications via London, UK.
+
+    The London Italy site uses the same login and booking pages as the Dublin
+    Netherlands one, so only the destination differs from `AsyncVfsBotNl`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, source_country_code: str):
+        super().__init__(source_country_code)
+        self.destination_country_code = "IT"